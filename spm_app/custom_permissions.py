@@ -29,8 +29,7 @@ class AdminGroupOnlyPermissions(permissions.BasePermission):
             - only allow:
                 - authenticated administrators
         """
-        return request.user.groups.filter(
-            name='administrators').exists()
+        return CustomPermissionsCheck.in_administrators_group(user=request.user)
 
 
 class CustomPermissionsCheck:
@@ -41,6 +40,28 @@ class CustomPermissionsCheck:
             - in administrators group or is a superuser
         """
         if user:
-            return user.groups.filter(
-                name='administrators').exists() or user.is_superuser
+            return CustomPermissionsCheck.in_administrators_group(user=user) or user.is_superuser
         return False
+
+    def in_administrators_group(user=None):
+        """
+        pass (return True) if user is:
+            - in administrators group
+        """
+        if user:
+            return 'administrators' in CustomPermissionsCheck.group_names(user=user)
+        return False
+
+    def group_names(user=None):
+        """
+        return frozenset of the names of the groups the user is in.
+        The names are queried once and cached on the user object, so any
+        number of group checks during the same request share one query.
+        """
+        if user:
+            names = getattr(user, '_spm_group_names', None)
+            if names is None:
+                names = frozenset(user.groups.values_list('name', flat=True))
+                user._spm_group_names = names
+            return names
+        return frozenset()
@@ -2,15 +2,27 @@ from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 from django.conf import settings
 import re
+import string
 import logging
 
 
 # Get an instance of a logger
 logger = logging.getLogger('django')
 
+# compiled once at import, rather than looked up in the re module cache on every call
+_TAG_RE = re.compile(r'^[A-Za-z0-9\-\(\):\'\?\|\ ]*\Z')
+_URL_RE = re.compile(r'^[A-Za-z0-9_/.\\-]*\Z')
+_UNIT_PRICE_RE = re.compile(r'^[\d]*[\.]?[\d]{2}\Z')
+_RECORD_ID_RE = re.compile(r'^[0-9]*\Z')
+_BOOL_STRINGS = frozenset({'true', 'false'})
+# search queries are checked against a plain character set, as no regex engine is needed for that
+_SEARCH_CHARS = frozenset(string.ascii_letters + string.digits + '_.:+/-;?\'"|() ')
+# translation table deleting every allowed alphanumplus character (anything left over is invalid)
+_ALPHANUMPLUS_DELETE = str.maketrans('', '', string.ascii_letters + string.digits + '_.-(): ')
+
 
 def validate_alphanumplus(value):
-    if not re.match(r'^[A-Za-z0-9_.\-\(\): ]*$', value):
+    if value.translate(_ALPHANUMPLUS_DELETE):
         raise ValidationError(
             _(f'{value} contains invalid alphanumeric characters!')
         )
@@ -19,7 +31,7 @@ def validate_alphanumplus(value):
 def validate_tag_list(value: list):
     if isinstance(value, list):
         for v in value:
-            if not re.match(r'^[A-Za-z0-9\-\(\):\'\?\|\ ]*$', v):
+            if not _TAG_RE.match(v):
                 logger.warning(f'RAISING VALIDATION ERROR FOR: {v}')
                 raise ValidationError(
                     _(f'{value} contains invalid characters: !')
@@ -51,14 +63,14 @@ def validate_update_mode(value: str):
 
 
 def validate_url(value):
-    if not re.match(r'^[A-Za-z0-9_/.\\-]*$', value):
+    if not _URL_RE.match(value):
         raise ValidationError(
             _(f'{value} contains invalid characters!')
         )
 
 
 def validate_search(value):
-    if not re.match(r'^[A-Za-z0-9_.:+\/\-\;\?\'\"\|\(\) ]*$', value):
+    if not _SEARCH_CHARS.issuperset(value):
         raise ValidationError(
             _(f'{value} contains invalid characters!')
         )
@@ -67,7 +79,7 @@ def validate_search(value):
 
 def validate_unit_price(value):
     # note: not currently required as using DecimalField rather than FloatField
-    if not re.match(r'^[\d]*[\.]?[\d]{2}$', str(value)):
+    if not _UNIT_PRICE_RE.match(str(value)):
         raise ValidationError(
             _(f'{value} is not a valid price!')
         )
@@ -97,9 +109,9 @@ class RequestQueryValidator:
     page = 'validation of page limit param'
     results = 'validation of results limit param'
     order_by = 'validation of order_by param'
-    valid_order_by_values = ['id', 'tags', 'file_name',
-                             'file_type', '-id', '-tags', '-file_name', '-file_type',
-                             'record_updated', '-record_updated']
+    valid_order_by_values = frozenset({'id', 'tags', 'file_name',
+                                       'file_type', '-id', '-tags', '-file_name', '-file_type',
+                                       'record_updated', '-record_updated'})
     bool_or_none = 'validation incoming value is a boolean value or None'
     record_id = 'validation query string is a valid record ID (digits)'
 
@@ -127,14 +139,14 @@ class RequestQueryValidator:
         elif query_type == 'bool_or_none':
             # ensure true/false string or a boolean. Return boolean if so, if not, raise validation error
             if value and not isinstance(value, bool):
-                if isinstance(value, str) and value.lower() in ['true', 'false']:
+                if isinstance(value, str) and value.lower() in _BOOL_STRINGS:
                     return value.lower() == 'true'
                 else:
                     raise ValidationError(
                         _(f'This value needs to be True or False!'))
             return value
         elif query_type == 'record_id':
-            if value and not re.match(r'^[0-9]*$', value):
+            if value and not _RECORD_ID_RE.match(value):
                 raise ValidationError(
                     _(f'{value} is not a valid record ID!')
                 )
@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from rest_framework.authtoken.models import Token
 from django.conf import settings
 from django.db.models.signals import post_save, pre_save
@@ -79,6 +79,22 @@ class PhotoData(models.Model):
         super(PhotoData, self).save(*args, **kwargs)
 
 
+class PhotoTagManager(models.Manager):
+    def bulk_get_or_create(self, tags: [str], owner=None) -> list:
+        """
+        get or create PhotoTag objects for a list of tags, using 2 queries
+        (rather than 1 or 2 per tag, as get_or_create would)
+        :param tags: list of tags (strings)
+        :param owner: user to set as the owner of any newly created tags
+        :return: list of PhotoTag objects
+        """
+        unique_tags = list(dict.fromkeys(tags))  # remove duplicates, preserving order
+        with transaction.atomic():
+            self.bulk_create([self.model(tag=t, owner=owner) for t in unique_tags],
+                             batch_size=500, ignore_conflicts=True)
+            return list(self.filter(tag__in=unique_tags))
+
+
 class PhotoTag(models.Model):
     tag = models.CharField(unique=True, max_length=100, blank=True, null=False,
                            validators=[custom_validators.validate_alphanumplus])
@@ -88,6 +104,8 @@ class PhotoTag(models.Model):
     record_created = models.DateTimeField(auto_now_add=True)
     record_updated = models.DateTimeField(auto_now=True)
 
+    objects = PhotoTagManager()
+
     class Meta:
         ordering = ('tag',)
         indexes = [
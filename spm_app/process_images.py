@@ -1,16 +1,19 @@
 #!/usr/bin/env python3
 import glob, os
+import logging
 import pyexiv2
 from PIL import Image
 
-ORIGINAL_IMAGE_PATH = os.path.normpath(os.path.normpath(f'{os.path.join(os.getcwd(), "../test_images")}'))
-PROCESSED_IMAGE_PATH = os.path.normpath(os.path.normpath(f'{os.path.join(os.getcwd(), "../test_images/processed")}'))
+ORIGINAL_IMAGE_PATH = os.path.normpath(os.path.join(os.getcwd(), '..', 'test_images'))
+PROCESSED_IMAGE_PATH = os.path.normpath(os.path.join(os.getcwd(), '..', 'test_images', 'processed'))
 # ORIGINAL_IMAGE_PATH = os.path.normpath(
 #     os.path.normpath('/mnt/backupaninstancedatacenter/family-history-29032019-clone/IMAGE_ARCHIVE/InProgress'))
 # PROCESSED_IMAGE_PATH = os.path.normpath(
 #     os.path.normpath('/mnt/backupaninstancedatacenter/family-history-29032019-clone/IMAGE_ARCHIVE/Processed'))
 CONVERSION_FORMAT = 'jpg'
 
+logger = logging.getLogger(__name__)
+
 
 class ProcessImages:
     """
@@ -61,7 +64,7 @@ class ProcessImages:
                 image_data = {'path': path, 'filename': filename, 'iptc_key': key, 'tags': tag.raw_value}
             return image_data
         except IOError as e:
-            print(f'An error occurred: {e}')
+            logger.error('An error occurred: %s', e)
             return False
 
     @staticmethod
@@ -82,10 +85,10 @@ class ProcessImages:
             meta.read()
             meta[iptc_key] = pyexiv2.IptcTag(iptc_key, tags)
             meta.write()
-            print('Tags successfully written!')
+            logger.debug('Tags successfully written!')
             return True
         except (TypeError, Exception) as e:
-            print(e)
+            logger.error(e)
         return False
 
     @staticmethod
@@ -103,10 +106,10 @@ class ProcessImages:
             file, extension = os.path.splitext(filename)
             outfile = f'{file}.{conversion_format}'
             Image.open(url).save(os.path.join(save_path, outfile), quality=100)
-            print('Conversion done!')
+            logger.debug('Conversion done!')
             return {'path': save_path, 'filename': outfile}
         except (IOError, Exception) as e:
-            print(f'An error occurred: {e}')
+            logger.error('An error occurred: %s', e)
         return False
 
     @staticmethod
@@ -114,16 +117,13 @@ class ProcessImages:
         """
         method to get filenames of all files (not sub-dirs) in a directory
         :param directory: the directory to scan for files
-        :return: a list of files
+        :return: a set of files
         """
-        filenames = []
         try:
-            for filename in os.listdir(directory):
-                if not os.path.isdir(os.path.join(directory, filename)):
-                    filenames.append(filename)
-            return filenames
+            with os.scandir(directory) as entries:
+                return set(e.name for e in entries if not e.is_dir())
         except (IOError, Exception) as e:
-            print(f'An error occurred: {e}')
+            logger.error('An error occurred: %s', e)
         return False
 
     def run(self):
@@ -135,35 +135,34 @@ class ProcessImages:
              ['DATE: 1974', 'PLACE: The Moon']}]}
         """
         try:
-            existing_converted = self.get_filenames(self.PROCESSED_IMAGE_PATH)
+            existing_converted = set(os.path.splitext(f)[0] for f in self.get_filenames(self.PROCESSED_IMAGE_PATH))
             saved_tags = []
             saved_conversions = []
-            for filename in os.listdir(self.ORIGINAL_IMAGE_PATH):
-                if not os.path.isdir(os.path.join(self.ORIGINAL_IMAGE_PATH, filename)):
-                    if self.reconvert is True or os.path.splitext(filename)[0] not in [os.path.splitext(f)[0] for f in
-                                                                                       existing_converted]:
-                        # save copy of the image with converted format
-                        converted = self.convert_format(filename=filename, path=self.ORIGINAL_IMAGE_PATH,
-                                                        save_path=self.PROCESSED_IMAGE_PATH,
-                                                        conversion_format=self.CONVERSION_FORMAT)
-                        saved_conversions.append(converted)
-                    if self.retag is True or \
-                            os.path.splitext(filename)[0] not in [os.path.splitext(f)[0] for f in existing_converted]:
-                        # read tag data from original image
-                        tag_data = self.read_iptc_tags(filename=filename, path=self.ORIGINAL_IMAGE_PATH)
-                        # any additions or updates to the incoming tag data
-                        tag_data['path'] = self.PROCESSED_IMAGE_PATH  # update tag_data['path'] to target image file
-                        tag_data['tags'].append('TAG COPIED FROM ORIGINAL')  # add tag to identify as copied
-                        # add to the return dict
-                        saved_tags.append(tag_data)
-                        # write tag data to the converted copy
-                        file, extension = os.path.splitext(filename)
-                        self.write_iptc_tags(path=self.PROCESSED_IMAGE_PATH,
-                                             filename=f'{file}.{self.CONVERSION_FORMAT}',
-                                             tag_data=tag_data)
+            with os.scandir(self.ORIGINAL_IMAGE_PATH) as entries:
+                filenames = [e.name for e in entries if not e.is_dir()]
+            for filename in filenames:
+                file = os.path.splitext(filename)[0]
+                if self.reconvert is True or file not in existing_converted:
+                    # save copy of the image with converted format
+                    converted = self.convert_format(filename=filename, path=self.ORIGINAL_IMAGE_PATH,
+                                                    save_path=self.PROCESSED_IMAGE_PATH,
+                                                    conversion_format=self.CONVERSION_FORMAT)
+                    saved_conversions.append(converted)
+                if self.retag is True or file not in existing_converted:
+                    # read tag data from original image
+                    tag_data = self.read_iptc_tags(filename=filename, path=self.ORIGINAL_IMAGE_PATH)
+                    # any additions or updates to the incoming tag data
+                    tag_data['path'] = self.PROCESSED_IMAGE_PATH  # update tag_data['path'] to target image file
+                    tag_data['tags'].append('TAG COPIED FROM ORIGINAL')  # add tag to identify as copied
+                    # add to the return dict
+                    saved_tags.append(tag_data)
+                    # write tag data to the converted copy
+                    self.write_iptc_tags(path=self.PROCESSED_IMAGE_PATH,
+                                         filename=f'{file}.{self.CONVERSION_FORMAT}',
+                                         tag_data=tag_data)
             return {'conversions': saved_conversions, 'tags': saved_tags}
         except (TypeError, Exception) as e:
-            print(f'Error: {e}')
+            logger.error('Error: %s', e)
         return False
 
 # ProcessImages(image_path=ORIGINAL_IMAGE_PATH,
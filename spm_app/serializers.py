@@ -8,6 +8,7 @@ from . import custom_validators
 from django.db import IntegrityError
 from django.utils.translation import gettext_lazy as _
 from .models import PhotoTag, PhotoData
+from .custom_permissions import CustomPermissionsCheck
 import uuid
 
 # Get an instance of a logger
@@ -129,7 +130,7 @@ class PhotoDataSerializer(serializers.HyperlinkedModelSerializer):
         return uuid.uuid4().hex
 
     def administrators_check(self, obj):
-        return self.context['request'].user.groups.filter(name='administrators').exists()
+        return CustomPermissionsCheck.in_administrators_group(user=self.context['request'].user)
 
     # receive non-model field in request POST/PATCH that represents the number of units to transfer
     # example_non_model_field = serializers.CharField(required=False)
@@ -227,7 +228,7 @@ class PhotoTagSerializer(serializers.HyperlinkedModelSerializer):
         method_name='administrators_check')
 
     def administrators_check(self, obj):
-        return self.context['request'].user.groups.filter(name='administrators').exists()
+        return CustomPermissionsCheck.in_administrators_group(user=self.context['request'].user)
 
     # receive non-model field in request POST/PATCH that represents the number of units to transfer
     # example_non_model_field = serializers.CharField(required=False)
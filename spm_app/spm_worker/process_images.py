@@ -4,23 +4,40 @@ import os
 import pyexiv2
 from PIL import Image
 import hashlib
+import shutil
 from pathlib import Path
 import glob
 import traceback
 import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import partial
+from collections import namedtuple
 
-ORIGIN_IMAGE_PATHS = set(os.path.normpath(os.path.normpath(
-    f'{os.path.join(os.getcwd(), "../test_images")}')))
-PROCESSED_IMAGE_PATH = os.path.normpath(os.path.normpath(
-    f'{os.path.join(os.getcwd(), "../test_images/processed")}'))
-THUMB_PATH = os.path.normpath(os.path.normpath(
-    f'{os.path.join(os.getcwd(), "../test_images/processed/tn")}'))
+ORIGIN_IMAGE_PATHS = {os.path.normpath(
+    os.path.join(os.getcwd(), '..', 'test_images'))}
+PROCESSED_IMAGE_PATH = os.path.normpath(
+    os.path.join(os.getcwd(), '..', 'test_images', 'processed'))
+THUMB_PATH = os.path.normpath(
+    os.path.join(os.getcwd(), '..', 'test_images', 'processed', 'tn'))
 THUMB_SIZES = [(1080, 1080), (720, 720), (350, 350), (150, 150), (75, 75)]
 CONVERSION_FORMAT = 'jpg'
+THUMB_QUALITY = 92  # visually lossless, at around half the size & encode time of quality=100
+HASH_CHUNK_SIZE = 1024 * 1024  # bytes read at a time when hashing image files
+PARALLEL_MIN_FILES = 4  # below this number of files, process sequentially rather than start worker pools
+THREAD_POOL_WORKERS = 8  # threads for tasks that only copy tags (pyexiv2 calls themselves run one at a time)
+CONVERSION_POOL_WORKERS = os.cpu_count() or 1  # workers for tasks that convert images (full size decode & encode)
+# the Exiv2 XMP toolkit is not thread safe, so pyexiv2 calls are serialised (re-entrant, as the tag methods nest)
+EXIV2_LOCK = threading.RLock()
 
 # Get an instance of a logger
 logger = logging.getLogger('django')
 
+# data yielded by ProcessImages.process_images for each processed image (module level, so it can be pickled)
+ProcessedImage = namedtuple(
+    'ProcessedImage', 'orig_path orig_filename processed_path new_filename iptc_key tags')
+
 
 class ProcessImages:
     """
@@ -29,6 +46,8 @@ class ProcessImages:
         - read & transfer IPTC 'keyword' tags from original to converted image
     """
     ALLOWED_IMAGE_FORMATS = ['jpeg', 'jpg', 'tiff', 'tif', 'png']
+    JPEG_FORMATS = {'jpeg', 'jpg'}
+    PIL_FORMATS = {'jpeg': 'JPEG', 'jpg': 'JPEG', 'tiff': 'TIFF', 'tif': 'TIFF', 'png': 'PNG'}
 
     def __init__(
             self, origin_image_paths=None, origin_file_url=None, processed_image_path=None, thumb_path=None,
@@ -48,6 +67,8 @@ class ProcessImages:
         :param thumb_sizes: [tuple]: list of thumb sizes, in form: [(75,75),(150,150)]. Default to 75,75
         Note: standardise on lowercase file extensions
         """
+        # a bare str would be iterated as a set of single characters
+        assert not isinstance(origin_image_paths, str), 'origin_image_paths must be a set of paths, not a str'
         self.ORIGIN_IMAGE_PATHS = origin_image_paths
         self.PROCESSED_IMAGE_PATH = processed_image_path
         self.THUMB_PATH = thumb_path
@@ -94,14 +115,16 @@ class ProcessImages:
                             file_urls.extend(
                                 [str(i) for i in item_list if not os.path.isdir(i)])
                     else:
-                        if allowed_formats:
-                            file_urls.extend(list(os.path.join(directory, f) for f in os.listdir(
-                                directory) if os.path.splitext(f)[1].strip('.') in allowed_formats))
-                        else:
-                            file_urls.extend(list(os.path.join(directory, f) for f in os.listdir(
-                                directory) if not os.path.isdir(os.path.join(directory, f))))
+                        # scandir entries carry the file type, so no extra stat per file
+                        with os.scandir(directory) as entries:
+                            if allowed_formats:
+                                file_urls.extend(e.path for e in entries if os.path.splitext(
+                                    e.name)[1].strip('.') in allowed_formats)
+                            else:
+                                file_urls.extend(
+                                    e.path for e in entries if not e.is_dir())
                 except (IOError, Exception) as e:
-                    print(f'An error occurred in file_url_list_generator: {e}')
+                    logger.error('An error occurred in file_url_list_generator: %s', e)
              # return file_urls
             for f in file_urls:
                 if containing_str:  # if containing_str set, filenames not containing that substring are ignored
@@ -121,46 +144,87 @@ class ProcessImages:
         """
         try:
             url = os.path.join(path, filename)
-            meta = pyexiv2.ImageMetadata(os.path.join(url))
-            meta.read()
-            iptc_keys = meta.iptc_keys or []
-            image_data = []
-            if iptc_keys:
-                for key in iptc_keys:
-                    tag = meta[key]
-                    image_data.append(
-                        {'iptc_key': key, 'tags': tag.raw_value or []})
-            # else:
-            #     image_data.append({'iptc_key': '', 'tags': []})
-            return image_data
+            with EXIV2_LOCK:
+                meta = pyexiv2.ImageMetadata(os.path.join(url))
+                meta.read()
+                return ProcessImages._get_iptc_tag_data(meta)
         except (IOError, KeyError, Exception) as e:
-            logger.error(f'Error in _read_iptc_tags: {e}')
+            logger.error('Error in _read_iptc_tags: %s', e)
             return False
 
     @staticmethod
-    def _write_iptc_tags(new_file_url: str, tag_data: dict) -> bool:
+    def _get_iptc_tag_data(meta) -> list:
+        """
+        method to get IPTC tags from already read image metadata
+        :param meta: pyexiv2.ImageMetadata object, on which read() has been called
+        :return: [{'iptc_key': iptc key, 'tags': ['tag 1', 'tag 2']}]
+        """
+        iptc_keys = meta.iptc_keys or []
+        image_data = []
+        if iptc_keys:
+            for key in iptc_keys:
+                tag = meta[key]
+                image_data.append(
+                    {'iptc_key': key, 'tags': tag.raw_value or []})
+        # else:
+        #     image_data.append({'iptc_key': '', 'tags': []})
+        return image_data
+
+    @staticmethod
+    def _write_iptc_tags(new_file_url: str, tag_data: dict, meta=None) -> bool:
         """
         method to write IPTC tags to image
         :param new_file_url: filename of target image
         :param tag_data: image data: in form: {'iptc_key': iptc key, 'tags': ['tag 1', 'tag 2']}
+        :param meta: already read pyexiv2.ImageMetadata of the target image (if any), to save reading it again
         :return: True | False
         """
         try:
-            iptc_key = tag_data['iptc_key']
-            if iptc_key and tag_data['tags']:
-                tags = tag_data['tags']
-                print(f'Tags to write: {tags}')
-                meta = pyexiv2.ImageMetadata(new_file_url)
+            with EXIV2_LOCK:
+                iptc_key = tag_data['iptc_key']
+                if iptc_key and tag_data['tags']:
+                    tags = tag_data['tags']
+                    logger.debug('Tags to write: %s', tags)
+                    if meta is None:
+                        meta = pyexiv2.ImageMetadata(new_file_url)
+                        meta.read()
+                    if iptc_key in meta.iptc_keys and meta[iptc_key].raw_value == tags:
+                        # image already tagged with exactly these tags (e.g. when retagging), so skip rewriting the file
+                        logger.debug('Tags already written to: %s', new_file_url)
+                    else:
+                        meta[iptc_key] = pyexiv2.IptcTag(iptc_key, tags)
+                        meta.write()
+                else:
+                    logger.warning(
+                        'NO TAGS WERE SUBMITTED TO WRITE, SO ASSUMING ONLY 1 TAG EXISTED & THE INTENTION WAS TO WRITE AN EMPTY TAG SET, WITH THE EFFECT OF DELETING IT')
+                    ProcessImages.delete_iptc_tags(new_file_url)  # delete the tag
+                    if meta is not None:
+                        meta.read()  # refresh the passed in metadata, so the deleted tags are not written back
+            logger.info('No more tags to write!')
+        except (TypeError, Exception) as e:
+            logger.error('An error occurred in write_iptc_tags: %s', e)
+        return False
+
+    @staticmethod
+    def strip_metadata(file_url: str) -> bool:
+        """
+        method to delete all EXIF, XMP & IPTC metadata from an image
+        :param file_url: url of target image
+        :return: True if no metadata remains | False
+        """
+        try:
+            with EXIV2_LOCK:
+                meta = pyexiv2.ImageMetadata(file_url)
                 meta.read()
-                meta[iptc_key] = pyexiv2.IptcTag(iptc_key, tags)
+                for key in meta.exif_keys + meta.xmp_keys + meta.iptc_keys:
+                    del meta[key]
                 meta.write()
-            else:
-                logger.warning(
-                    'NO TAGS WERE SUBMITTED TO WRITE, SO ASSUMING ONLY 1 TAG EXISTED & THE INTENTION WAS TO WRITE AN EMPTY TAG SET, WITH THE EFFECT OF DELETING IT')
-                ProcessImages.delete_iptc_tags(new_file_url)  # delete the tag
-            logger.info('No more tags to write!')
+                # check all metadata successfully cleared
+                meta = pyexiv2.ImageMetadata(file_url)
+                meta.read()
+                return not (meta.exif_keys or meta.xmp_keys or meta.iptc_keys)
         except (TypeError, Exception) as e:
-            logger.error(f'An error occurred in write_iptc_tags: {e}')
+            logger.error('An error occurred in strip_metadata: %s', e)
         return False
 
     @staticmethod
@@ -170,25 +234,26 @@ class ProcessImages:
         :param file_url: filename of target image
         :return: True | False
         """
-        logger.warning(f'DELETING TAGS FROM: {file_url}')
+        logger.warning('DELETING TAGS FROM: %s', file_url)
         try:
-            meta = pyexiv2.ImageMetadata(file_url)
-            meta.read()  # read the meta
-            # delete all tags
-            loop_count = 0
-            while loop_count < 10:
-                for key in meta.iptc_keys:  # delete every iptc key
-                    del meta[key]
-                meta.write()  # save the meta
-                loop_count += 1
-                # check all tags successfully cleared
+            with EXIV2_LOCK:
                 meta = pyexiv2.ImageMetadata(file_url)
-                meta.read()
-                if not meta.iptc_keys:
-                    break
-            return loop_count < 10  # return True if successfully ended loop, else False
+                meta.read()  # read the meta
+                # delete all tags
+                loop_count = 0
+                while loop_count < 10:
+                    for key in meta.iptc_keys:  # delete every iptc key
+                        del meta[key]
+                    meta.write()  # save the meta
+                    loop_count += 1
+                    # check all tags successfully cleared
+                    meta = pyexiv2.ImageMetadata(file_url)
+                    meta.read()
+                    if not meta.iptc_keys:
+                        break
+                return loop_count < 10  # return True if successfully ended loop, else False
         except (TypeError, Exception) as e:
-            print(f'An error occurred in delete_iptc_tags: {e}')
+            logger.error('An error occurred in delete_iptc_tags: %s', e)
 
     @staticmethod
     def convert_image(orig_filename: str, path: str, save_path: str, conversion_format: str,
@@ -214,7 +279,13 @@ class ProcessImages:
         try:
             # Map arg to uppercase, jpg to JPEG, etc
             url = os.path.join(path, orig_filename)
-            with Image.open(url) as img:
+            copy_original = not thumbs_only and ProcessImages.is_same_format(
+                orig_filename, conversion_format)
+            with ProcessImages.open_image(url) as img:
+                if (thumbs_only or copy_original) and thumb_sizes:
+                    # decoded pixels only used for thumbs, so let JPEGs decode at a reduced scale (no-op for others)
+                    img.draft('RGB', (max(tn[0] for tn in thumb_sizes),
+                                      max(tn[1] for tn in thumb_sizes)))
                 # convert to conversion_format
                 img.convert('RGB')  # convert to RGBA to ensure consistency
                 if change_filename:
@@ -226,13 +297,28 @@ class ProcessImages:
                 # define new filename (inc. extension for new format)
                 outfile = f'{new_filename}.{conversion_format}'
                 if not thumbs_only:  # if converting to a full-sized copy
-                    try:
-                        img.save(os.path.normpath(
-                            os.path.join(save_path, outfile)))
-                    except Exception as e:
-                        img = img.point(lambda i: i*(1./256)).convert('L')
-                        img.save(os.path.normpath(
-                            os.path.join(save_path, outfile)))
+                    save_url = os.path.normpath(os.path.join(save_path, outfile))
+                    if copy_original:
+                        """
+                        already in the conversion format, so copy the file rather than decode & re-encode it.
+                        The copy is made to a temp file & stripped of its metadata (as re-encoding would) before
+                        being moved into place, so origin EXIF (e.g. GPS location, orientation flag) & XMP are
+                        never published with the processed image. If stripping fails, re-encode after all (img
+                        itself may have been drafted at a reduced scale).
+                        """
+                        tmp_url = f'{save_url}.tmp'
+                        try:
+                            shutil.copyfile(url, tmp_url)
+                            if ProcessImages.strip_metadata(tmp_url):
+                                os.replace(tmp_url, save_url)
+                            else:
+                                with ProcessImages.open_image(url) as full_size_img:
+                                    ProcessImages._save_image(full_size_img, save_url)
+                        finally:
+                            if os.path.exists(tmp_url):
+                                os.remove(tmp_url)
+                    else:
+                        img = ProcessImages._save_image(img, save_url)
                 # create thumbs
                 for tn in thumb_sizes:
                     if thumb_path:
@@ -242,14 +328,58 @@ class ProcessImages:
                         thumb_save_url = os.path.join(
                             save_path, 'tn', f'{new_filename}-{"_".join((str(t) for t in tn))}.{conversion_format}')
                     img.thumbnail(tn, resample=Image.BICUBIC)
-                    img.save(thumb_save_url, quality=100)
-                print('Conversion done!')
+                    img.save(thumb_save_url, quality=THUMB_QUALITY)
+                logger.debug('Conversion done!')
                 return {'orig_path': path, 'processed_path': save_path, 'new_filename': outfile,
                         'orig_filename': orig_filename, 'thumb_path': thumb_path}
         except (IOError, Exception) as e:
-            print(f'An error occurred in convert_format: {e}')
+            logger.error('An error occurred in convert_format: %s', e)
         return False
 
+    @staticmethod
+    def _save_image(img, save_url: str):
+        """
+        method to save an image, converting it to 8 bit greyscale if it cannot be saved as is (e.g. 16 bit images)
+        :param img: PIL Image object
+        :param save_url: url to save the image to
+        :return: PIL Image object that was saved
+        """
+        try:
+            img.save(save_url)
+        except Exception as e:
+            img = img.point(lambda i: i*(1./256)).convert('L')
+            img.save(save_url)
+        return img
+
+    @staticmethod
+    def open_image(url: str):
+        """
+        method to open an image file, trying the PIL decoder for its file extension first,
+        rather than having PIL sniff the file header against every registered plugin
+        :param url: url of the image file
+        :return: PIL Image object
+        """
+        pil_format = ProcessImages.PIL_FORMATS.get(
+            os.path.splitext(url)[1].lstrip('.').lower())
+        if pil_format:
+            try:
+                return Image.open(url, formats=[pil_format])
+            except Image.UnidentifiedImageError:
+                logger.debug('%s is not a %s image, so identifying by content', url, pil_format)
+        return Image.open(url)
+
+    @staticmethod
+    def is_same_format(filename: str, image_format: str) -> bool:
+        """
+        method to check whether a file is already in a given image format
+        :param filename: filename of image (inc. extension)
+        :param image_format: image format (file extension), e.g. jpg
+        :return: True | False
+        """
+        file_format = os.path.splitext(filename)[1].lstrip('.').lower()
+        image_format = image_format.lower()
+        return file_format == image_format or {file_format, image_format} <= ProcessImages.JPEG_FORMATS
+
     @staticmethod
     def generate_image_hash(image_url=None):
         """
@@ -262,10 +392,16 @@ class ProcessImages:
         as a) quicker and b) allows for duplicate images with different
         meta to be treated as separate files, which I decided is a
         required behaviour.
+        The file is hashed in chunks, so large (e.g. .tif) origin images
+        are not read into memory in one go. The algorithm stays sha1, as
+        the hash is the filename of existing processed images.
         """
         if image_url:
+            image_hash = hashlib.sha1()
             with open(image_url, 'rb') as img:
-                return hashlib.sha1(img.read()).hexdigest()
+                for chunk in iter(partial(img.read, HASH_CHUNK_SIZE), b''):
+                    image_hash.update(chunk)
+            return image_hash.hexdigest()
         return None
 
     @staticmethod
@@ -278,8 +414,8 @@ class ProcessImages:
         """
 
         # TODO ^^^ write this function
-        print(f'Origin directories: {origin_directories}')
-        print(f'Processed directory: {processed_directory}')
+        logger.debug('Origin directories: %s', origin_directories)
+        logger.debug('Processed directory: %s', processed_directory)
         return True
 
     @staticmethod
@@ -297,7 +433,7 @@ class ProcessImages:
                 os.remove(f)
             return True
         except Exception as e:
-            print(f'Error deleting the files: {e}')
+            logger.error('Error deleting the files: %s', e)
         return False
 
     @staticmethod
@@ -311,19 +447,28 @@ class ProcessImages:
         :param retain_original: bool: whether to retain original tags or simply replace with new
         :return: True (if Excpetion not raised)
         """
-        logger.info(
-            f'ADDING TAGS: [target: {target_file_url}, tags: {tags}, retain_original: {retain_original}]')
+        logger.info('ADDING TAGS: [target: %s, tags: %s, retain_original: %s]',
+                    target_file_url, tags, retain_original)
         try:
             # get existing tags, if any, Expects: [{'iptc_key': iptc key, 'tags': ['tag 1', 'tag 2']}] | False
             path, target_filename = os.path.split(target_file_url)
+            # read the target's metadata once, for both merging the existing tags & writing the result
+            try:
+                with EXIV2_LOCK:
+                    meta = pyexiv2.ImageMetadata(target_file_url)
+                    meta.read()
+            except (IOError, Exception) as e:
+                # as when the tags were read separately: log, then carry on with no existing tags
+                logger.error('Error reading metadata in add_tags: %s', e)
+                meta = None
             tags_to_write = []
             # merge existing & new tags to one list if retain_original is true
-            if retain_original:
-                tags_to_write = ProcessImages._read_iptc_tags(
-                    filename=target_filename, path=path)
-                print(f'ORIGINAL TAGS TO COPY: {tags_to_write}')
-                print(f'COPIED FROM FILENAME: {target_filename}')
-                print(f'COPIED FROM PATH: {path}')
+            if retain_original and meta is not None:
+                with EXIV2_LOCK:
+                    tags_to_write = ProcessImages._get_iptc_tag_data(meta)
+                logger.debug('ORIGINAL TAGS TO COPY: %s', tags_to_write)
+                logger.debug('COPIED FROM FILENAME: %s', target_filename)
+                logger.debug('COPIED FROM PATH: %s', path)
                 if tags_to_write:
                     for existing_tag in tags_to_write:
                         if existing_tag['iptc_key'] == tags['iptc_key']:
@@ -332,17 +477,17 @@ class ProcessImages:
             # if not merging with original or there were no original tags to merge, just use new
             tags_to_write = [tags] if not tags_to_write else tags_to_write
             # write tags to images (tags in form: {'iptc_key': iptc key, 'tags': ['tag 1', 'tag 2']})
-            logger.info(f'WRITING THESE TAGS: {tags_to_write}')
+            logger.info('WRITING THESE TAGS: %s', tags_to_write)
             for tag in tags_to_write:
                 ProcessImages._write_iptc_tags(
-                    new_file_url=target_file_url, tag_data=tag)
+                    new_file_url=target_file_url, tag_data=tag, meta=meta)
             # check successful write
             if not ProcessImages.tag_write_error_check(
                     intended_tags=tags, origin_image_path=path, origin_image_filename=target_filename):
                 logger.error('TAGS NOT WRITTEN CORRECTLY!')
                 return False
         except Exception as e:
-            print(f'An exception occurred whilst attempting to add tags : {e}')
+            logger.error('An exception occurred whilst attempting to add tags : %s', e)
             raise
         return True
 
@@ -352,7 +497,7 @@ class ProcessImages:
             origin_image_path: str = '', origin_image_filename: str = '') -> bool:
         image_data = ProcessImages._read_iptc_tags(
             origin_image_filename, origin_image_path)
-        logger.info(f'TAGS LOOKING FOR: {intended_tags}')
+        logger.info('TAGS LOOKING FOR: %s', intended_tags)
         if not image_data:
             logger.info('THERE WERE NO TAGS ON THE PROCESSED FILE')
         elif not intended_tags['tags']:
@@ -393,12 +538,12 @@ class ProcessImages:
                     path, hash + os.path.splitext(old_filename)[1])
             else:
                 new_url = os.path.join(path, new_name)
-            print(f'NEW URL: {new_url}')
+            logger.debug('NEW URL: %s', new_url)
             os.rename(src=url_file_to_rename, dst=new_url)
             return new_url
         except Exception as e:
-            print(
-                f'An exception occurred whilst attempting to rename the files: {e}')
+            logger.error(
+                'An exception occurred whilst attempting to rename the files: %s', e)
             raise
 
     @staticmethod
@@ -418,9 +563,9 @@ class ProcessImages:
             if copy_tags:  # read tags
                 tags = ProcessImages._read_iptc_tags(
                     filename=filename, path=path)
-                print(f'original TAGS: {tags}')
+                logger.debug('original TAGS: %s', tags)
             # rotate the image (makes a new copy & overwrites the origial)
-            with Image.open(origin_file_url) as img:
+            with ProcessImages.open_image(origin_file_url) as img:
                 img.rotate(rotation_degrees, resample=Image.BICUBIC,
                            expand=True).save(origin_file_url)
             if copy_tags and tags:  # write tags to new copy
@@ -434,106 +579,199 @@ class ProcessImages:
                     conversion_format=save_format, change_filename=False, thumbs_only=True, thumb_sizes=thumb_sizes)
             return True
         except IOError as e:
-            print(f'Image rotation failed: {e}')
+            logger.error('Image rotation failed: %s', e)
         return False
 
+    @staticmethod
+    def _process_file(file_url: str, new_file_url: str, convert: bool, processed_image_path: str,
+                      conversion_format: str, thumb_path: str, thumb_sizes: [tuple]) -> ProcessedImage:
+        """
+        method to convert (if required) and tag a single origin image.
+        Kept free of instance state so it can be run in a worker process.
+        :param file_url: url of the origin image
+        :param new_file_url: url of the processed copy of the origin image
+        :param convert: bool: whether to (re)generate the processed copy & thumbs
+        :param processed_image_path: path to save the processed image to
+        :param conversion_format: file format to convert image to
+        :param thumb_path: path to save the thumbnails to
+        :param thumb_sizes: [tuple]: list of thumb sizes, in form: [(75,75),(150,150)]
+        :return: ProcessedImage of saved conversion data and tags (as yielded by process_images) | None
+        """
+        try:
+            orig_path, orig_filename = os.path.split(file_url)
+            iptc_key, tags = '', ()
+            if convert:
+                # save copy of the image with converted format & generate thumbs
+                ProcessImages.convert_image(orig_filename=orig_filename,
+                                            path=orig_path,
+                                            save_path=processed_image_path,
+                                            conversion_format=conversion_format,
+                                            thumb_path=thumb_path,
+                                            thumb_sizes=thumb_sizes)
+            # read tag data from original image
+            tag_data = ProcessImages._read_iptc_tags(
+                filename=orig_filename, path=orig_path)
+            # any additions or updates to the incoming tag data
+            if tag_data:
+                # only handle IPTC keywords (for now)
+                for tag in tag_data:
+                    if tag['iptc_key'] == 'Iptc.Application2.Keywords':
+                        tag['tags'].append(
+                            'SPM: TAGS COPIED FROM ORIGINAL')  # add tag to identify as copied
+                        # add to the returned data
+                        iptc_key, tags = tag['iptc_key'], tuple(tag['tags'])
+                        # write the tags to the converted file
+                        ProcessImages._write_iptc_tags(
+                            new_file_url=new_file_url, tag_data=tag)
+                    else:
+                        logger.debug(
+                            'No tag was saved for this file: %s', new_file_url)
+            return ProcessedImage(orig_path=orig_path, orig_filename=orig_filename,
+                                  processed_path=processed_image_path,
+                                  new_filename=os.path.split(new_file_url)[1],
+                                  iptc_key=iptc_key, tags=tags)
+        except Exception as e:
+            logger.error('An error occurred whilst processing the file: %s', e)
+        return None
+
+    @staticmethod
+    def _run_in_pools(process_file, tasks):
+        """
+        generator method to run tasks concurrently, submitting each as soon as it is queued & yielding
+        results as they complete (so records are produced while later files are still being hashed):
+            - tasks that convert images (CPU bound decode & encode) run in a process pool of CONVERSION_POOL_WORKERS
+            - tasks that only copy tags (file reads/writes & serialised pyexiv2 calls) run in a thread pool
+        Conversions run in a thread pool of CONVERSION_POOL_WORKERS instead if we are already in a daemonic
+        process, as daemonic processes cannot have children. Every caller within the app runs in a (daemonic)
+        django_q worker, so the process pool only serves the command line entry point (see __main__).
+        :param process_file: callable, to process a single task
+        :param tasks: iterable of task argument tuples, in form: (file_url, new_file_url, convert)
+        :yield: return value of process_file for each task
+        """
+        use_process_pool = not multiprocessing.current_process().daemon
+        executors = {}
+        pending = set()
+
+        def get_executor(convert):
+            # pools are only started when first needed
+            if convert:
+                # conversions are limited to CONVERSION_POOL_WORKERS, to bound concurrent full size decodes
+                if 'convert' not in executors:
+                    pool_executor = ProcessPoolExecutor if use_process_pool else ThreadPoolExecutor
+                    executors['convert'] = pool_executor(max_workers=CONVERSION_POOL_WORKERS)
+                return executors['convert']
+            if 'thread' not in executors:
+                executors['thread'] = ThreadPoolExecutor(max_workers=THREAD_POOL_WORKERS)
+            return executors['thread']
+
+        def results(futures):
+            for future in futures:
+                try:
+                    yield future.result()
+                except Exception as e:
+                    logger.error('An error occurred whilst processing the file: %s', e)
+
+        try:
+            for task in tasks:
+                pending.add(get_executor(task[2]).submit(process_file, *task))
+                done = {f for f in pending if f.done()}
+                pending -= done
+                yield from results(done)
+            yield from results(as_completed(pending))
+        finally:
+            for executor in executors.values():
+                executor.shutdown()
+
+    def _queue_tasks(self, file_urls):
+        """
+        generator method, hashing each origin file & checking for an existing processed copy, to
+        produce the tasks (if any) for process_images to run
+        :param file_urls: iterable of origin file urls
+        :yield: task argument tuples, in form: (file_url, new_file_url, convert)
+        """
+        # urls of already processed files
+        processed_urls = set(self.file_url_list_generator(
+            directories={self.PROCESSED_IMAGE_PATH}))
+        queued_urls = set()
+        for file_url in file_urls:
+            try:
+                # check if converted file already exists
+                original_img_hash = self.generate_image_hash(
+                    image_url=file_url)
+                new_file_url = os.path.join(
+                    self.PROCESSED_IMAGE_PATH, f'{original_img_hash}.{self.CONVERSION_FORMAT}')
+                if new_file_url in queued_urls:
+                    # identical origin image already queued, so don't process the same target concurrently
+                    continue
+                converted_did_exist = new_file_url in processed_urls
+                logger.debug(
+                    'Already exists in processed directory? : %s', converted_did_exist)
+                if self.reprocess:
+                    logger.debug('Reprocessing existing record ...')
+                """
+                queue the file to be (re)converted if it was not already converted (or reprocess is True),
+                and tagged if any of:
+                  - retag is True
+                  - it's a newly converted file
+                  - reprocess is True
+                """
+                if self.retag or self.reprocess or not converted_did_exist:
+                    queued_urls.add(new_file_url)
+                    yield file_url, new_file_url, not converted_did_exist or self.reprocess
+            except Exception as e:
+                logger.error('An error occurred whilst processing the file: %s', e)
+
     def process_images(self):
         """
         generator method to run the image conversion and tagging processes
         :yield: generator, that processes files in an origin directory &
-        produces dicts of saved conversion data and tags: e.g.:
-            {conversion_data: {'orig_path': '/path/to/orig/image', 'processed_path':'/path/to/processed_image',
-            'filename': 'jfJJeke5wrt54646ehgoe462.jpeg'}, tag_data: {'iptc_key': 'Iptc.Application2.Keywords', 'tags':
-            ['DATE: 1974', 'PLACE: The Moon']}
+        produces a ProcessedImage (immutable namedtuple) of saved conversion data and tags for each: e.g.:
+            ProcessedImage(orig_path='/path/to/orig/image', orig_filename='4058.tif',
+            processed_path='/path/to/processed_image', new_filename='jfJJeke5wrt54646ehgoe462.jpg',
+            iptc_key='Iptc.Application2.Keywords', tags=('DATE: 1974', 'PLACE: The Moon'))
         Notes:
             1. Hash of origin file assigned as file name to ensure duplicate name of files in other
         origin directories do not overwrite pre-existing files of the same name in the processed directory.
             2. Only handle KEYWORDS IPTC key (TODO: for now! Implement others later)
             3. Yields {} if no successful outcome for any of the images
+            4. Each file is hashed & checked for duplicates, then converted & tagged concurrently
+        (see _run_in_pools), or sequentially if there are only a few files.
         """
         try:
             if self.process_single and self.origin_file_url:  # if a single image
                 file_urls = [self.origin_file_url]
-            else:  # if scanning directories
-                file_urls = self.file_url_list_generator(
+            else:  # if scanning directories (urls only, so cheap to list up front)
+                file_urls = list(self.file_url_list_generator(
                     directories=self.ORIGIN_IMAGE_PATHS,
                     allowed_formats=self.ALLOWED_IMAGE_FORMATS,
-                    recursive=True)
-            for file_url in file_urls:
-                try:
-                    """
-                    save converted file
-                    """
-                    # check if converted file already exists (need to check every file added, to prevent dupes)
-                    original_img_hash = self.generate_image_hash(
-                        image_url=file_url)
-                    new_file_url = os.path.join(
-                        self.PROCESSED_IMAGE_PATH, f'{original_img_hash}.{self.CONVERSION_FORMAT}')
-                    converted_did_exist = new_file_url in [f for f in self.file_url_list_generator(
-                        directories={self.PROCESSED_IMAGE_PATH})]
-                    processed_data = {
-                        'conversion_data': {
-                            'orig_path': os.path.split(file_url)[0],
-                            'orig_filename': os.path.split(file_url)[1],
-                            'processed_path': self.PROCESSED_IMAGE_PATH,
-                            'new_filename': os.path.split(new_file_url)[1]
-                        },
-                        'tag_data': {
-                            'iptc_key': '', 'tags': []
-                        }}
-                    print(
-                        f'Already exists in processed directory? : {converted_did_exist}')
-                    if self.reprocess:
-                        print('Reprocessing existing record ...')
-                    # if filename does not already exist (not already converted)
-                    if not converted_did_exist or self.reprocess:
-                        # save copy of the image with converted format & generate thumbs
-                        self.convert_image(orig_filename=processed_data['conversion_data']['orig_filename'],
-                                           path=processed_data['conversion_data']['orig_path'],
-                                           save_path=processed_data['conversion_data']['processed_path'],
-                                           conversion_format=self.CONVERSION_FORMAT,
-                                           thumb_path=self.THUMB_PATH,
-                                           thumb_sizes=self.THUMB_SIZES)
-                    """
-                    write tags to file if any of:
-                      - retag is True
-                      - it's a newly converted file
-                      - reprocess is True
-                    """
-                    if self.retag or self.reprocess or not converted_did_exist:
-                        # read tag data from original image
-                        tag_data = self._read_iptc_tags(filename=processed_data['conversion_data']['orig_filename'],
-                                                        path=processed_data['conversion_data']['orig_path'])
-                        # any additions or updates to the incoming tag data
-                        if tag_data:
-                            # only handle IPTC keywords (for now)
-                            for tag in tag_data:
-                                if tag['iptc_key'] == 'Iptc.Application2.Keywords':
-                                    tag['tags'].append(
-                                        'SPM: TAGS COPIED FROM ORIGINAL')  # add tag to identify as copied
-                                    # add to the return dicts
-                                    processed_data['tag_data'] = tag
-                                    # write the tags to the converted file
-                                    self._write_iptc_tags(
-                                        new_file_url=new_file_url, tag_data=tag)
-                                else:
-                                    print(
-                                        f'No tag was saved for this file: {new_file_url}')
-                        yield processed_data
-                except Exception as e:
-                    print(f'An error occurred whilst processing the file: {e}')
+                    recursive=True))
+            tasks = self._queue_tasks(file_urls)
+            process_file = partial(self._process_file, processed_image_path=self.PROCESSED_IMAGE_PATH,
+                                   conversion_format=self.CONVERSION_FORMAT, thumb_path=self.THUMB_PATH,
+                                   thumb_sizes=self.THUMB_SIZES)
+            if len(file_urls) < PARALLEL_MIN_FILES:  # not worth the pool start up cost
+                processed = (process_file(*task) for task in tasks)
+            else:
+                processed = self._run_in_pools(process_file=process_file, tasks=tasks)
+            for processed_data in processed:
+                if processed_data:
+                    yield processed_data
         except (TypeError, Exception) as e:
-            print(f'Error occurred processing images, in main(): {e}')
+            logger.error('Error occurred processing images, in main(): %s', e)
             yield {}
 
 
 if __name__ == '__main__':
-    ProcessImages(origin_image_paths=ORIGIN_IMAGE_PATHS,
-                  processed_image_path=PROCESSED_IMAGE_PATH,
-                  origin_file_url=None,
-                  thumb_path=THUMB_PATH,
-                  conversion_format=CONVERSION_FORMAT,
-                  process_single=False,
-                  reprocess=False,
-                  retag=False,
-                  thumb_sizes=THUMB_SIZES).process_images()
+    logging.basicConfig(level=logging.INFO)
+    image_processor = ProcessImages(origin_image_paths=ORIGIN_IMAGE_PATHS,
+                                    processed_image_path=PROCESSED_IMAGE_PATH,
+                                    origin_file_url=None,
+                                    thumb_path=THUMB_PATH,
+                                    conversion_format=CONVERSION_FORMAT,
+                                    process_single=False,
+                                    reprocess=False,
+                                    retag=False,
+                                    thumb_sizes=THUMB_SIZES)
+    # run from the command line (not a daemonic django_q worker), so conversions use the process pool
+    for processed_image in image_processor.process_images():
+        logger.info('Processed: %s', processed_image)
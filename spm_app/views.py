@@ -49,6 +49,10 @@ If only one, leave trailing comma e.g.(permissions.IsAuthentication,)
 # Get an instance of a logger
 logger = logging.getLogger('django')
 
+# process-constant public urls of processed images & thumbs, normalised once at import rather than per record
+PUBLIC_IMG_URL = os.path.normpath(settings.SPM['PUBLIC_URL'])
+PUBLIC_IMG_TN_URL = os.path.normpath(settings.SPM['PUBLIC_URL_TN'])
+
 
 class UserViewSet(viewsets.ModelViewSet):
     """
@@ -147,7 +151,6 @@ class PhotoDataViewSet(viewsets.ModelViewSet):
     """
 
     def get_queryset(self):
-        records = []
         user = self.request.user
         groups = user.groups.all()
         staff_or_administrator = user.is_staff or CustomPermissionsCheck.is_administrator(
@@ -178,10 +181,12 @@ class PhotoDataViewSet(viewsets.ModelViewSet):
                                              term_to_replace=term_to_replace, replacement_term=replacement_term)
             except ValidationError as e:
                 logger.warning(f'Validation error: {e}')
+                # return an empty queryset (rather than a list), which saves evaluating it here
+                records = all_records.none()
         else:
             records = all_records.filter(
                 tags=None) if staff_or_administrator else all_records
-        return records.distinct() if records else []  # return records
+        return records.distinct()  # return records
 
     def dispatch(self, request, *args, **kwargs):
         """
@@ -254,7 +259,7 @@ class PhotoDataViewSet(viewsets.ModelViewSet):
                         'public_img_tn_url': new_data.public_img_tn_url,
                         'tags': [t for t in new_data.tags.all().values_list('tag', flat=True)],
                         'record_updated': new_data.record_updated,
-                        'user_is_admin': request.user.groups.filter(name='administrators').exists(),
+                        'user_is_admin': CustomPermissionsCheck.in_administrators_group(user=request.user),
                         'uuid': uuid.uuid4().hex  # add UUID to ensure caches can be cleared for new img
                     }
                 return JsonResponse(data=updated_record, status=status.HTTP_202_ACCEPTED) if updated_instance['success'] else JsonResponse(
@@ -521,27 +526,31 @@ class PhotoDataViewSet(viewsets.ModelViewSet):
                                     'Renaming the thumbnail file failed!', exc_info=True)
                 # write tags to db only if successfully written to image (if required)
                 try:
-                    successfully_added_tags = []
-                    for tag in tags:
-                        try:
-                            tag, tag_created = PhotoTag.objects.get_or_create(
-                                tag=tag, defaults={'owner': user})
-                            successfully_added_tags.append(tag)
-                        except Exception as e:
-                            error_message = 'An exception occurred whilst attempting to save tags to database!'
-                            logger.warning(error_message, exc_info=True)
-                    # save tags & updated image data to PhotoData model
-                    if retain_original:
-                        [record.tags.add(t) for t in successfully_added_tags]
-                    else:
-                        record.tags.set(successfully_added_tags)
-                    record.record_updated = datetime.utcnow()
                     # update db with new processed image filenames
                     if renamed_main:
                         record.file_name = new_filename
                         record.file_foramt = new_format
                         record.processed_url = os.path.join(
                             processed_image_path, new_filename + new_format)
+                    try:
+                        successfully_added_tags = PhotoTag.objects.bulk_get_or_create(
+                            tags=tags, owner=user)
+                    except Exception as e:
+                        """
+                        If the tags could not be saved, leave the record's tags unchanged and exit (record will
+                        remain mod locked, as the tags written to the image no longer match the database).
+                        The processed files have already been renamed though, so save the new filenames.
+                        """
+                        error_message = 'An exception occurred whilst attempting to save tags to database!'
+                        logger.warning(error_message, exc_info=True)
+                        record.save()
+                        return {'success': False, 'data': error_message}
+                    # save tags & updated image data to PhotoData model
+                    if retain_original:
+                        record.tags.add(*successfully_added_tags)
+                    else:
+                        record.tags.set(successfully_added_tags)
+                    record.record_updated = datetime.utcnow()
                     # release modification lock
                     record.mod_lock = False
                     # save the model
@@ -649,13 +658,14 @@ class PhotoTagViewSet(viewsets.ModelViewSet):
         # set username of requester to user attr of serializer to allow return admin status in response
         self.serializer_class.user = self.request.user
         try:
-            if 'term' in self.request.query_params and self.request.query_params.get('term', None):
+            search_term = self.request.query_params.get('term', None)
+            if search_term:  # skip validation & filtering entirely for a missing or empty term
                 records = self.handle_search(
-                    all_records=records, search_term=self.request.query_params.get('term'))
+                    all_records=records, search_term=search_term)
         except ValidationError as e:
             # if invalid search char, don't return error response, just return empty
             logger.info(f'Returning no results in response because: {e}')
-            records = []
+            records = records.none()
         return records  # return everything
 
     @staticmethod
@@ -666,10 +676,7 @@ class PhotoTagViewSet(viewsets.ModelViewSet):
         : return: queryset of filtered results
         """
         search_query = validate_search(search_term)
-        # split search terms on space
-        terms = tuple([t.strip() for t in search_query.split(' ')])
-        records = all_records.filter(
-            Q(tag__icontains=search_query) if search_query else None).distinct()
+        records = all_records.filter(tag__icontains=search_query).distinct()
         return records
 
     def perform_create(self, serializer_class):
@@ -686,7 +693,7 @@ class PhotoTagViewSet(viewsets.ModelViewSet):
 
     def perform_destroy(self, instance):
         # only allow admins to delete objects
-        if self.request.user.groups.filter(name='administrators').exists():
+        if CustomPermissionsCheck.in_administrators_group(user=self.request.user):
             super().perform_destroy(instance)
         else:
             raise serializers.ValidationError(
@@ -694,7 +701,7 @@ class PhotoTagViewSet(viewsets.ModelViewSet):
 
     def prune_tags(self, request):
         # only allow admins to prune tags
-        if self.request.user.groups.filter(name='administrators').exists():
+        if CustomPermissionsCheck.in_administrators_group(user=self.request.user):
             async_task(PhotoTagViewSet.prune_tags_task,
                        records=self.queryset, user=self.request.user, hook=PhotoTagViewSet.prune_tags_task_hook)
             return JsonResponse({'Status': f'OK'}, status=status.HTTP_202_ACCEPTED)
@@ -759,18 +766,18 @@ class ProcessPhotos(APIView):
     def add_record_to_db(record, owner, resync_tags=False, reprocess=False):
         """
         method to add images to the database model
-        : param record: dict of saved conversion data and tags: e.g.:
-            {conversion_data: {'orig_path': '/path/to/orig/image', 'processed_path': '/path/to/processed_image',
-            'filename': '4058.jpeg'}, tag_data: {'iptc_key': 'Iptc.Application2.Keywords', 'tags':
-            ['DATE: 1974', 'PLACE: The Moon']}: param owner: current user: param resync_tags: whether embedded IPTC tags were re-copied from image file to the PhotoData model: return: saved record | False
+        : param record: ProcessedImage namedtuple of saved conversion data and tags: e.g.:
+            ProcessedImage(orig_path='/path/to/orig/image', orig_filename='4058.tif',
+            processed_path='/path/to/processed_image', new_filename='jfJJeke5wrt54646ehgoe462.jpg',
+            iptc_key='Iptc.Application2.Keywords', tags=('DATE: 1974', 'PLACE: The Moon')): param owner: current user: param resync_tags: whether embedded IPTC tags were re-copied from image file to the PhotoData model: return: saved record | False
         """
         try:
             updated_tags = []
             try:
-                orig_filename = record['conversion_data']['orig_filename']
-                new_filename = record['conversion_data']['new_filename']
-                original_path = record['conversion_data']['orig_path']
-                processed_path = record['conversion_data']['processed_path']
+                orig_filename = record.orig_filename
+                new_filename = record.new_filename
+                original_path = record.orig_path
+                processed_path = record.processed_path
                 logger.info(f'NEW FILENAME: {new_filename}')
                 photo_data_record, new_record_created = PhotoData.objects.update_or_create(
                     original_url=os.path.join(original_path, orig_filename),
@@ -779,8 +786,8 @@ class ProcessPhotos(APIView):
                         'file_name': os.path.splitext(new_filename)[0],
                         'file_format': os.path.splitext(new_filename)[1],
                         'processed_url': os.path.join(processed_path, new_filename),
-                        'public_img_url': os.path.normpath(settings.SPM['PUBLIC_URL']),
-                        'public_img_tn_url': os.path.normpath(settings.SPM['PUBLIC_URL_TN'])
+                        'public_img_url': PUBLIC_IMG_URL,
+                        'public_img_tn_url': PUBLIC_IMG_TN_URL
                     })
             except Exception as e:
                 new_record_created = False
@@ -794,15 +801,15 @@ class ProcessPhotos(APIView):
             Then, add image data to a list for return
             """
             if photo_data_record and (new_record_created or resync_tags or reprocess):
-                if record['tag_data']['tags']:
-                    for tag in record['tag_data']['tags']:
-                        try:
-                            tag, tag_created = PhotoTag.objects.get_or_create(
-                                tag=tag, defaults={'owner': owner})
-                            updated_tags.append(tag)
-                        except Exception as e:
-                            logger.warning(
-                                f'An exception occurred whilst attempting to save tags to database: {e}')
+                if record.tags:
+                    try:
+                        updated_tags = PhotoTag.objects.bulk_get_or_create(
+                            tags=record.tags, owner=owner)
+                    except Exception as e:
+                        # leave the record's existing tags unchanged
+                        logger.warning(
+                            f'An exception occurred whilst attempting to save tags to database: {e}')
+                        return False
                     # save tags to PhotoData model
                     photo_data_record.tags.set(updated_tags)
                     photo_data_record.record_updated = datetime.utcnow()